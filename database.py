@@ -121,13 +121,16 @@ class NEODatabase:
         """
         # Generate `CloseApproach` objects that match all of the filters.
         if filters:
-            for approach in self._approaches:
-                # The all() function returns True if all items in an iterable
-                # are true, otherwise it returns False.
-                # If the iterable object is empty, the all() function also
-                # returns True.
-                if all(filter(approach) for filter in filters):
-                    yield approach
+            # Each criterion becomes one lazy pass of the built-in `filter`
+            # over the stream, so the iteration itself runs in C; each
+            # criterion is still a Python call per approach.
+            approaches = iter(self._approaches)
+            for criterion in filters:
+                if not callable(criterion):
+                    # `filter(None, ...)` would silently test truthiness.
+                    raise TypeError(f"{criterion!r} is not a callable filter")
+                approaches = filter(criterion, approaches)
+            yield from approaches
         else:
             # return all the close approaches (if no arguments are provided)
             for approach in self._approaches:
@@ -14,13 +14,29 @@ command line, and uses the resulting collections to build an `NEODatabase`.
 You'll edit this file in Task 2.
 """
 import csv
-import json
-import traceback
+import sys
+from operator import itemgetter
 from typing import List
 
+try:
+    import orjson as _json  # Optional: a much faster C JSON parser.
+except ImportError:
+    import json as _json
+
+try:
+    # Optional: a drop-in `float` with a faster C string-to-float path.
+    from fastnumbers import float as _float
+except ImportError:
+    _float = float
+
+from helpers import cd_to_datetime
 from models import NearEarthObject, CloseApproach
 
 
+# NASA's `pha` flag, mapped to whether the NEO is potentially hazardous.
+_PHA = {'Y': True, 'N': False, '': False}
+
+
 def load_neos(neo_csv_path: str) -> List[NearEarthObject]:
     """Read near-Earth object information from a CSV file.
 
@@ -30,19 +46,42 @@ def load_neos(neo_csv_path: str) -> List[NearEarthObject]:
     """
     with open(neo_csv_path, 'r') as infile:
         neos = []
-        reader = csv.DictReader(infile)
-        for elem in reader:
+        reader = csv.reader(infile)
+
+        # Read the header once and project only the four columns we use out
+        # of each row, with a single C-level call per row.
+        header = next(reader, None)
+        if header is None:
+            # An empty file has no header and no NEOs.
+            return neos
+        columns = itemgetter(*[header.index(column) for column in
+                               ("pdes", "name", "pha", "diameter")])
+
+        # Bind the factory and helpers locally to skip lookups per row.
+        from_row = NearEarthObject._from_row
+        intern = sys.intern
+        is_hazardous = _PHA.get
+        to_float = _float
+        nan = float('nan')
+        skipped = 0
+        for row in reader:
+            # Blank lines come back as empty rows; skip them like
+            # `csv.DictReader` does.
+            if not row:
+                continue
+            # Skip malformed rows (too short, or with a diameter that isn't a
+            # number), and report them all at once at the end.
             try:
-                neo = NearEarthObject(
-                    designation = elem["pdes"],
-                    name = elem["name"],
-                    hazardous = elem["pha"],
-                    diameter = elem["diameter"]
-                )
-            except Exception as e:
-                print("load_neos: ", e, "Traceback: ", traceback.format_exc())
-            else:
-                neos.append(neo)
+                pdes, name, pha, diameter = columns(row)
+                diameter = to_float(diameter) if diameter else nan
+            except (IndexError, ValueError):
+                skipped += 1
+                continue
+            neos.append(from_row(intern(pdes), name or None,
+                                 is_hazardous(pha, False), diameter))
+    if skipped:
+        print(f"load_neos: skipped {skipped} malformed row(s).",
+              file=sys.stderr)
     return neos
 
 
@@ -53,22 +92,46 @@ def load_approaches(cad_json_path: str) -> List[CloseApproach]:
                           approaches.
     :return: A collection of `CloseApproach`es.
     """
-    with open(cad_json_path, 'r') as infile:
-        approaches = []
-        contents = json.load(infile)  # Parse JSON data into a Python object.
-        
-        # Create a `CloseApproach` for each row of data.
-        for data in contents["data"]:
+    with open(cad_json_path, 'rb') as infile:
+        # Parse the raw bytes into a Python object; both parsers accept bytes
+        # and decode UTF-8 themselves, which saves a text-decoding pass.
+        contents = _json.loads(infile.read())
+
+        # Look up the positions of the columns we need once, instead of
+        # building a dict for every row, and project them out of each row
+        # with a single C-level call.
+        fields = contents["fields"]
+        columns = itemgetter(*[fields.index(key) for key in
+                               ("des", "cd", "dist", "v_rel")])
+
+        # The number of rows is known up front, so allocate the result once
+        # and fill it by index; the tail left by skipped rows is trimmed below.
+        approaches = [None] * len(contents["data"])
+        count = 0
+
+        # Bind the factory and helpers locally to skip lookups per row.
+        from_row = CloseApproach._from_row
+        intern = sys.intern
+        to_datetime = cd_to_datetime
+        to_float = _float
+
+        # Create a `CloseApproach` for each row of data, counting malformed
+        # rows to report them all at once at the end. Designations repeat for
+        # every approach of the same NEO, so intern them to share one string
+        # (and to let the NEO lookup in `NEODatabase` hit on identity).
+        skipped = 0
+        for row in contents["data"]:
             try:
-                cad_row = dict(zip(contents["fields"], data))
-                ca = CloseApproach(
-                    designation = cad_row["des"],
-                    time = cad_row["cd"],
-                    distance = cad_row["dist"],
-                    velocity = cad_row["v_rel"])
-            except Exception as e:
-                print("load_approaches: ", e,
-                "Traceback: ", traceback.format_exc())
+                des, cd, dist, v_rel = columns(row)
+                ca = from_row(intern(des), to_datetime(cd),
+                              to_float(dist), to_float(v_rel))
+            except (IndexError, TypeError, ValueError):
+                skipped += 1
             else:
-                approaches.append(ca)
+                approaches[count] = ca
+                count += 1
+        del approaches[count:]
+    if skipped:
+        print(f"load_approaches: skipped {skipped} malformed row(s).",
+              file=sys.stderr)
     return approaches
\ No newline at end of file
@@ -18,6 +18,7 @@ quirks of the data set, such as missing names and unknown diameters.
 You'll edit this file in Task 1.
 """
 from helpers import cd_to_datetime, datetime_to_str
+import datetime
 import math
 
 
@@ -34,6 +35,9 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    # Fixed attribute slots instead of a per-instance `__dict__`.
+    __slots__ = ("designation", "name", "diameter", "hazardous", "approaches")
+
     def __init__(self, **info):
         """Create a new `NearEarthObject`.
 
@@ -56,6 +60,27 @@ class NearEarthObject:
         # Initial collection of linked approaches.
         self.approaches = []
 
+    @classmethod
+    def _from_row(cls, designation, name, hazardous, diameter):
+        """Create a new `NearEarthObject` from already-converted values.
+
+        This is the fast path used by `extract.load_neos`: it skips the
+        keyword-argument dict and the conversions done in `__init__`.
+
+        :param designation: The primary designation, as a string.
+        :param name: The IAU name, or `None`.
+        :param hazardous: Whether the NEO is potentially hazardous, as a bool.
+        :param diameter: The diameter in kilometers, or `float('nan')`.
+        :return: A new `NearEarthObject`.
+        """
+        self = cls.__new__(cls)
+        self.designation = designation
+        self.name = name
+        self.hazardous = hazardous
+        self.diameter = diameter
+        self.approaches = []
+        return self
+
     @property
     def fullname(self):
         """Return a representation of the full name of this NEO."""
@@ -110,6 +135,9 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    # Fixed attribute slots instead of a per-instance `__dict__`.
+    __slots__ = ("_designation", "time", "distance", "velocity", "neo")
+
     def __init__(self, **info):
         """Create a new `CloseApproach`.
 
@@ -118,7 +146,7 @@ class CloseApproach:
         """
         self._designation = info.get("designation", '')  # des
         self.time = info.get("time", None)  # cd
-        if self.time:
+        if self.time and not isinstance(self.time, datetime.datetime):
             self.time = cd_to_datetime(self.time)  # datetime obj
         self.distance = float(info.get("distance", float('nan')))  # dist
         self.velocity = float(info.get("velocity", float('nan')))  # v_rel
@@ -126,6 +154,27 @@ class CloseApproach:
         # Create an attribute for the referenced NEO, originally None.
         self.neo = info.get("neo", None)
 
+    @classmethod
+    def _from_row(cls, designation, time, distance, velocity):
+        """Create a new `CloseApproach` from already-converted values.
+
+        This is the fast path used by `extract.load_approaches`: it skips the
+        keyword-argument dict and the conversions done in `__init__`.
+
+        :param designation: The primary designation of the NEO, as a string.
+        :param time: The approach time, as a `datetime`.
+        :param distance: The nominal approach distance in au, as a float.
+        :param velocity: The relative approach velocity in km/s, as a float.
+        :return: A new `CloseApproach`, not yet linked to its NEO.
+        """
+        self = cls.__new__(cls)
+        self._designation = designation
+        self.time = time
+        self.distance = distance
+        self.velocity = velocity
+        self.neo = None
+        return self
+
     @property
     def designation(self):
         """Getter designation.
@@ -11,10 +11,18 @@ To run these tests from the project root, run:
 These tests should pass when Task 2 is complete.
 """
 import collections.abc
+import contextlib
+import csv
 import datetime
+import importlib.util
+import io
+import json
 import pathlib
 import math
+import sys
+import tempfile
 import unittest
+import unittest.mock
 
 from extract import load_neos, load_approaches
 from models import NearEarthObject, CloseApproach
@@ -23,6 +31,7 @@ from models import NearEarthObject, CloseApproach
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
 TEST_NEO_FILE = TESTS_ROOT / 'test-neos-2020.csv'
 TEST_CAD_FILE = TESTS_ROOT / 'test-cad-2020.json'
+TEST_MALFORMED_NEO_FILE = TESTS_ROOT / 'test-neos-malformed.csv'
 
 
 class TestLoadNEOs(unittest.TestCase):
@@ -78,6 +87,38 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertEqual(neo.hazardous, True)
 
 
+class TestLoadMalformedNEOs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.stderr = io.StringIO()
+        with contextlib.redirect_stderr(cls.stderr):
+            cls.neos = load_neos(TEST_MALFORMED_NEO_FILE)
+        cls.neos_by_designation = {neo.designation: neo for neo in cls.neos}
+
+    def test_malformed_rows_are_skipped(self):
+        # The blank line is ignored; the short row and the row with a
+        # non-numeric diameter are skipped.
+        self.assertEqual(set(self.neos_by_designation),
+                         {'433', '719', '887', '1036'})
+
+    def test_skipped_rows_are_reported_once(self):
+        self.assertEqual(self.stderr.getvalue(),
+                         "load_neos: skipped 2 malformed row(s).\n")
+
+    def test_diameters_accepted_by_float_are_loaded(self):
+        self.assertEqual(self.neos_by_designation['719'].diameter, 1.0)
+        self.assertTrue(math.isnan(self.neos_by_designation['887'].diameter))
+        self.assertEqual(self.neos_by_designation['1036'].diameter, 10.0)
+
+
+class TestLoadEmptyNEOFile(unittest.TestCase):
+    def test_empty_file_has_no_neos(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / 'empty.csv'
+            path.touch()
+            self.assertEqual(load_neos(path), [])
+
+
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -118,5 +159,77 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+def neo_key(neo):
+    """Return the loaded attributes of an NEO, with NaN made comparable."""
+    return (neo.designation, neo.name, neo.hazardous, repr(neo.diameter),
+            neo.approaches)
+
+
+def approach_key(approach):
+    """Return the loaded attributes of a close approach."""
+    return (approach.designation, approach.time, approach.distance,
+            approach.velocity, approach.neo)
+
+
+def assert_same_keys(test, expected, received):
+    """Compare keys item by item; a diff of thousands of tuples is slow."""
+    test.assertEqual(len(expected), len(received))
+    for index, (left, right) in enumerate(zip(expected, received)):
+        test.assertEqual(left, right, msg=f"Mismatch at row {index}.")
+
+
+class TestFastConstructors(unittest.TestCase):
+    def test_neo_from_row_matches_init(self):
+        with open(TEST_NEO_FILE, 'r') as infile:
+            expected = [neo_key(NearEarthObject(designation=row["pdes"],
+                                                name=row["name"],
+                                                hazardous=row["pha"],
+                                                diameter=row["diameter"]))
+                        for row in csv.DictReader(infile)]
+        received = [neo_key(neo) for neo in load_neos(TEST_NEO_FILE)]
+        assert_same_keys(self, expected, received)
+
+    def test_approach_from_row_matches_init(self):
+        with open(TEST_CAD_FILE, 'r') as infile:
+            contents = json.load(infile)
+        expected = []
+        for data in contents["data"]:
+            row = dict(zip(contents["fields"], data))
+            expected.append(approach_key(CloseApproach(
+                designation=row["des"], time=row["cd"],
+                distance=row["dist"], velocity=row["v_rel"])))
+        received = [approach_key(approach)
+                    for approach in load_approaches(TEST_CAD_FILE)]
+        assert_same_keys(self, expected, received)
+
+    def test_approach_init_accepts_parsed_datetime(self):
+        time = datetime.datetime(2020, 12, 31, 12, 0)
+        approach = CloseApproach(designation='433', time=time,
+                                 distance='0.1', velocity='5.0')
+        self.assertIs(approach.time, time)
+
+
+class TestLoadApproachesWithStdlibJSON(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Load a separate copy of `extract` as if orjson weren't installed.
+        spec = importlib.util.spec_from_file_location(
+            'extract_without_orjson', TESTS_ROOT.parent / 'extract.py')
+        cls.extract = importlib.util.module_from_spec(spec)
+        with unittest.mock.patch.dict(sys.modules, {'orjson': None}):
+            spec.loader.exec_module(cls.extract)
+
+    def test_falls_back_to_stdlib_json(self):
+        self.assertIs(self.extract._json, json)
+
+    def test_stdlib_json_loads_same_approaches(self):
+        expected = [approach_key(approach)
+                    for approach in load_approaches(TEST_CAD_FILE)]
+        received = [approach_key(approach)
+                    for approach in self.extract.load_approaches(TEST_CAD_FILE)]
+        self.assertEqual(len(received), 4700)
+        assert_same_keys(self, expected, received)
+
+
 if __name__ == '__main__':
     unittest.main()
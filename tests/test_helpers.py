@@ -0,0 +1,45 @@
+"""Check that `cd_to_datetime` agrees with `strptime` on NASA's `cd` format.
+
+The `cd_to_datetime` function has a fast path for well-formed, fixed-width
+timestamps and falls back to `strptime` for everything else, so it should
+accept exactly what `strptime` accepts and produce the same result.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+"""
+import datetime
+import unittest
+
+from helpers import cd_to_datetime
+
+
+CD_FORMAT = "%Y-%b-%d %H:%M"
+
+
+class TestCdToDatetime(unittest.TestCase):
+    def test_valid_dates_match_strptime(self):
+        for calendar_date in ('2020-Dec-31 12:00', '1900-Jan-01 00:11',
+                              '2000-Feb-29 23:59', '2020-dec-31 12:00',
+                              '2020-Dec-3 12:00', '2020-Dec-31 1:05'):
+            with self.subTest(calendar_date=calendar_date):
+                self.assertEqual(
+                    cd_to_datetime(calendar_date),
+                    datetime.datetime.strptime(calendar_date, CD_FORMAT))
+
+    def test_malformed_dates_raise_value_error(self):
+        for calendar_date in ('2020xDecx31T12x00', '+020-Dec-31 12:00',
+                              '2020-Dec-+1 12:00', '2020-Dec-31 12:+1',
+                              '2020-Foo-31 12:00', '2020-Dec-32 12:00',
+                              '2021-Feb-29 12:00', '2020-Dec-31 24:00',
+                              '2020-Dec-31 12:00x', '2020-Dec-\u06621 12:00',
+                              ''):
+            with self.subTest(calendar_date=calendar_date):
+                with self.assertRaises(ValueError):
+                    datetime.datetime.strptime(calendar_date, CD_FORMAT)
+                with self.assertRaises(ValueError):
+                    cd_to_datetime(calendar_date)
+
+
+if __name__ == '__main__':
+    unittest.main()